@@ -11,7 +11,7 @@ setup(
         "Flask-SQLAlchemy",
         "python-dotenv",
         "hubspot-api-client-extended",
-        "redis",
+        "redis[hiredis]",
         "celery",
         "alembic",
     ],
@@ -1,9 +1,22 @@
-from .hubspot_integration_server import HubspotIntegrationServer
+from .hubspot_integration_server import HubspotIntegrationServer, get_server
 from .oauth_server import OAuthServer
-from .config import configuration
 from .database import db
 from .models import HubspotCredentials
-from . import services
+
+
+def __getattr__(name):
+    """
+    Resolve 'configuration' and 'services' lazily. The services package builds its
+    task decorators from the configuration, so importing it eagerly would load the
+    configuration (and the .env file) as soon as this package is imported.
+    """
+    if name == 'configuration':
+        from . import config
+        return config.configuration
+    if name == 'services':
+        from . import services
+        return services
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -12,5 +25,6 @@ __all__ = [
     'OAuthServer',
     'configuration',
     'db',
+    'get_server',
     'services',
 ]
\ No newline at end of file
@@ -1,35 +1,52 @@
 import os
 import logging
-from dotenv import load_dotenv
+from functools import lru_cache
 
 # Configure the logger
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
+@lru_cache(maxsize=None)
 def load_configuration():
-    """Load configurations and return them as a dictionary."""
-    # Load environment variables
-    load_dotenv()
+    """
+    Load configurations and return them as a dictionary.
 
+    The result is cached, so repeated calls reuse the same dictionary instead of
+    re-reading the .env file and the environment.
+    """
+    # Load environment variables from .env, unless disabled with LOAD_DOTENV=0
+    # (e.g. when the platform injects them) or a parent process already did so
+    if os.environ.get('LOAD_DOTENV', '1') == '1' and os.environ.get('ALREADY_LOADED_DOTENV') != '1':
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        os.environ['ALREADY_LOADED_DOTENV'] = '1'
+
+    g = os.environ.get
     config = {
-        'ROOT_URL': os.getenv('ROOT_URL'),
-        'HUBSPOT_CLIENT_ID': os.getenv('HUBSPOT_CLIENT_ID'),
-        'HUBSPOT_CLIENT_SECRET': os.getenv('HUBSPOT_CLIENT_SECRET'),
-        'HUBSPOT_OAUTH_REDIRECT_URL': os.getenv('HUBSPOT_OAUTH_REDIRECT_URL'),
-        'HUBSPOT_DEVELOPER_HAPIKEY': os.getenv('HUBSPOT_DEVELOPER_HAPIKEY'),
-        'HUBSPOT_APP_ID': os.getenv('HUBSPOT_APP_ID'),
-        'HUBSPOT_RATE_LIMIT': os.getenv('HUBSPOT_RATE_LIMIT'),
+        'ROOT_URL': g('ROOT_URL'),
+        'HUBSPOT_CLIENT_ID': g('HUBSPOT_CLIENT_ID'),
+        'HUBSPOT_CLIENT_SECRET': g('HUBSPOT_CLIENT_SECRET'),
+        'HUBSPOT_OAUTH_REDIRECT_URL': g('HUBSPOT_OAUTH_REDIRECT_URL'),
+        'HUBSPOT_DEVELOPER_HAPIKEY': g('HUBSPOT_DEVELOPER_HAPIKEY'),
+        'HUBSPOT_APP_ID': g('HUBSPOT_APP_ID'),
+        'HUBSPOT_RATE_LIMIT': g('HUBSPOT_RATE_LIMIT'),
+        'HUBSPOT_AUTO_CREATE_ALL': g('HUBSPOT_AUTO_CREATE_ALL', '').lower() in ('1', 'true', 'yes'),
         'FLASK_BASE_PATH': os.getcwd(),
         'FLASK_TEMPLATE_FOLDER': 'templates',
         'FLASK_INSTANCE_PATH': 'instance',
-        'SQLALCHEMY_DATABASE_URI': os.getenv('SQLALCHEMY_DATABASE_URI'),
-        'CELERY_BROKER_URL': os.getenv('CELERY_BROKER_URL'),
-        'CELERY_RESULT_BACKEND': os.getenv('CELERY_RESULT_BACKEND'),
+        'SQLALCHEMY_DATABASE_URI': g('SQLALCHEMY_DATABASE_URI'),
+        'CELERY_BROKER_URL': g('CELERY_BROKER_URL'),
+        'CELERY_RESULT_BACKEND': g('CELERY_RESULT_BACKEND'),
     }
 
     # Log critical values
-    logger.debug(f"Loaded configuration: {config}")
+    logger.debug("Loaded configuration: %s", config)
     return config
 
-# Call load_configuration and store the result in 'configuration'
-configuration = load_configuration()
+def __getattr__(name):
+    """Lazily load 'configuration' on first access, so importing this module does no I/O."""
+    if name == 'configuration':
+        global configuration
+        configuration = load_configuration()
+        return configuration
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,18 @@
 import os
 import logging
-from typing import Type
+from typing import Tuple, Type
 
-from celery import Celery
 from flask import Flask
+from sqlalchemy.pool import QueuePool
 
 from .database import db
 from .oauth_server import OAuthServer
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set logging level to debug
+
+# Flask config keys with this prefix configure Celery: CELERY_BROKER_URL sets
+# broker_url, CELERY_RESULT_BACKEND sets result_backend, and so on.
+CELERY_CONFIG_NAMESPACE = 'CELERY'
 
 
 class HubspotIntegrationServer(Flask):
@@ -18,6 +21,10 @@ class HubspotIntegrationServer(Flask):
 
     Handles initialization of services like Flask, SQLAlchemy, and OAuth server.
     """
+    # Packages whose 'tasks' modules are registered with Celery. Subclasses extend
+    # it rather than relying on a runtime scan, e.g.
+    # celery_task_packages = HubspotIntegrationServer.celery_task_packages + ('my_integration',)
+    celery_task_packages: Tuple[str, ...] = ('hubspot_integration_server_core.services',)
 
     def __init__(
             self,
@@ -30,9 +37,10 @@ class HubspotIntegrationServer(Flask):
         :param config: The configuration object for HubSpot integration.
         :param oauth_server_class: Class reference for OAuth server initialization.
         """
-        root_path = os.getenv('FLASK_BASE_PATH', os.getcwd())
-        instance_path=os.path.join(root_path, os.getenv('FLASK_INSTANCE_PATH', 'instance'))
-        template_folder=os.path.join(root_path, os.getenv('FLASK_TEMPLATE_FOLDER', 'templates'))
+        env = os.environ
+        root_path = env.get('FLASK_BASE_PATH', os.getcwd())
+        instance_path = os.path.join(root_path, env.get('FLASK_INSTANCE_PATH', 'instance'))
+        template_folder = os.path.join(root_path, env.get('FLASK_TEMPLATE_FOLDER', 'templates'))
         super().__init__(
             __name__,
             root_path=root_path,
@@ -41,12 +49,14 @@ class HubspotIntegrationServer(Flask):
         )
         self.config.update(config)
         self._oauth_server_class = oauth_server_class
+        self.services_initialized = False
 
         try:
             self._initialize_services()
+            self.services_initialized = True
             logger.debug("Services initialized successfully.")
         except Exception as e:
-            logger.exception(f"Failed to initialize services: {e}")
+            logger.exception("Failed to initialize services: %s", e)
 
     def _initialize_services(self):
         """
@@ -55,33 +65,49 @@ class HubspotIntegrationServer(Flask):
         try:
             # Initialize SQLAlchemy
             self.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+            # Size the connection pool explicitly unless the deployment configures it.
+            # SQLite uses its own pool classes, which reject these options.
+            if not str(self.config.get('SQLALCHEMY_DATABASE_URI') or '').startswith('sqlite'):
+                self.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+                    'pool_size': 20,
+                    'max_overflow': 10,
+                    'pool_pre_ping': True,
+                    'pool_recycle': 1800,
+                })
             db.init_app(self)
             logger.debug("SQLAlchemy initialized with URI: %s", self.config['SQLALCHEMY_DATABASE_URI'])
-            # Create all tables by SQLAlchemy
-            with self.app_context():
-                db.create_all()
-            logger.debug("Database tables created.")
+            # Create all tables by SQLAlchemy only when asked to; schemas are
+            # normally managed with Alembic migrations.
+            if self.config.get('HUBSPOT_AUTO_CREATE_ALL'):
+                with self.app_context():
+                    db.create_all()
+                logger.debug("Database tables created.")
         except Exception as e:
-            logger.exception(f"Failed to initialize SQLAlchemy: {e}")
+            logger.exception("Failed to initialize SQLAlchemy: %s", e)
             raise
 
         try:
             # Initialize Celery if configured
             if 'CELERY_BROKER_URL' in self.config:
-                self.celery = Celery(
-                    self.import_name,
-                    broker=self.config['CELERY_BROKER_URL'],
-                    backend=self.config['CELERY_RESULT_BACKEND'],
-                )
-                self.celery.conf.update(self.config)
-                # Automatically discover and register tasks from all files named tasks.py
-                # in your project.
-                self.celery.autodiscover_tasks()
+                # Imported here so servers without Celery skip its import chain;
+                # the package itself only imports services on first access.
+                from .services import celery_app
+
+                # All servers share the package's Celery app, which the tasks are
+                # registered against. Only hand it the CELERY_* settings, not the
+                # whole Flask config; the namespace maps them to Celery's own keys.
+                self.celery = celery_app
+                self.celery.config_from_object({
+                    key: value for key, value in self.config.items()
+                    if key.startswith(CELERY_CONFIG_NAMESPACE + '_')
+                }, namespace=CELERY_CONFIG_NAMESPACE)
+                # Register the tasks modules of the known task packages.
+                self.celery.autodiscover_tasks(self.celery_task_packages, force=True)
                 logger.debug("Celery initialized.")
             else:
                 logger.debug("Celery is not configured.")
         except Exception as e:
-            logger.exception(f"Failed to initialize Celery: {e}")
+            logger.exception("Failed to initialize Celery: %s", e)
             raise
 
         try:
@@ -89,5 +115,63 @@ class HubspotIntegrationServer(Flask):
             self.oauth_server = self._oauth_server_class(self, self.config)
             logger.debug("OAuth server initialized.")
         except Exception as e:
-            logger.exception(f"Failed to initialize OAuth server: {e}")
+            logger.exception("Failed to initialize OAuth server: %s", e)
             raise
+
+    def warm_database_pool(self):
+        """
+        Opens the configured number of pooled database connections up front, so the
+        first requests do not pay the connection setup cost.
+
+        This is not called during initialization: servers are usually built in a
+        parent process, and connections opened there must not be shared with forked
+        children. Call it in each worker process instead, e.g. from Gunicorn's
+        post_fork hook or Celery's worker_process_init signal::
+
+            def post_fork(server, worker):
+                app.warm_database_pool()
+
+            @worker_process_init.connect
+            def warm_worker_pool(**kwargs):
+                app.warm_database_pool()
+
+        Any connections inherited from the parent are discarded without closing them
+        before the pool is filled.
+        """
+        with self.app_context():
+            engine = db.engine
+            engine.dispose(close=False)
+            if not isinstance(engine.pool, QueuePool):
+                logger.debug("Database pool %s has no fixed size, not warming it.", type(engine.pool).__name__)
+                return
+            connections = [engine.raw_connection() for _ in range(engine.pool.size())]
+            for connection in connections:
+                connection.close()
+        logger.debug("Database pool warmed with %d connections.", len(connections))
+
+
+# Servers created by get_server(), keyed by class and configuration.
+_servers = {}
+
+
+def get_server(
+        config: dict,
+        oauth_server_class: Type[OAuthServer] = OAuthServer,
+        server_class: Type[HubspotIntegrationServer] = HubspotIntegrationServer,
+) -> HubspotIntegrationServer:
+    """
+    Returns the process-wide server for the given configuration, creating it on first
+    use. Calls with an equal configuration and classes return the same instance.
+    A server whose services failed to initialize is returned but not cached.
+
+    :param config: The configuration object for HubSpot integration. All values must be hashable.
+    :param oauth_server_class: Class reference for OAuth server initialization.
+    :param server_class: HubspotIntegrationServer (sub)class to instantiate.
+    """
+    key = (server_class, oauth_server_class, frozenset(config.items()))
+    server = _servers.get(key)
+    if server is None:
+        server = server_class(config, oauth_server_class)
+        if server.services_initialized:
+            _servers[key] = server
+    return server
@@ -18,6 +18,10 @@ class HubspotCredentials(db.Model):
         hubspot_access_token: OAuth access token for Hubspot API.
         hubspot_refresh_token: OAuth refresh token for Hubspot API.
         hubspot_expires_in: Token expiration time in seconds.
+
+    Relationships added to this model (or models referencing it) should use
+    lazy='select' or lazy='joined' rather than lazy='dynamic', which issues a
+    new query on every access.
     """
 
     id = db.Column(db.Integer, primary_key=True)
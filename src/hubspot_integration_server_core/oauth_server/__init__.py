@@ -1,17 +1,22 @@
-from typing import Optional
+import logging
+from typing import List, Optional
 
 from flask import Flask, Blueprint
 from .handlers import oauth_callback, process_oauth, success
 from ..database import db
-from hubspot import Client
 
 from hubspot_integration_server_core.models import HubspotCredentials
 
+logger = logging.getLogger(__name__)
+
 
 class OAuthServer:
     oauth_server_custom_form: Optional[str] = None
 
     def __init__(self, app: Flask, config: dict):
+        # Imported here so importing the package does not load the HubSpot client.
+        from hubspot import Client
+
         self.config = config
 
         self.oauth_blueprint = Blueprint('oauth', __name__)
@@ -36,4 +41,17 @@ class OAuthServer:
         db.session.add(credentials)
         db.session.commit()
 
-        print("New account created with ID:", credentials.id)
+        logger.info("New account created with ID: %s", credentials.id)
+
+    def process_tokens_bulk(self, credentials_data_list: List[dict]):
+        """
+        Stores several sets of OAuth credentials in a single commit.
+
+        :param credentials_data_list: A list of credentials dictionaries, as passed to process_tokens.
+        """
+        credentials_list = [HubspotCredentials(**credentials_data) for credentials_data in credentials_data_list]
+
+        db.session.bulk_save_objects(credentials_list)
+        db.session.commit()
+
+        logger.info("%d new accounts created.", len(credentials_list))
@@ -4,7 +4,6 @@ import logging
 
 # Initialize logger
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set logging level to debug
 
 def oauth_callback():
     """
@@ -1,2 +1,14 @@
+from celery import Celery
+
+# The Celery app shared by every HubspotIntegrationServer in the process.
+celery_app = Celery('hubspot_integration_server_core')
+
 from .tasks import RateLimitedTask, create_api_task_decorator, hubspot_task
-from . import hubspot
+
+
+def __getattr__(name):
+    """Import the 'hubspot' services, and with them the HubSpot client, on first access."""
+    if name == 'hubspot':
+        from . import hubspot
+        return hubspot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -25,7 +25,7 @@ def _custom_api_factory(api_client_package, api_name, config):
         api_client = api_client_package.ApiClient(configuration=configuration)
         return getattr(api_client_package, api_name)(api_client=api_client)
     except Exception as e:
-        logger.debug(f"Failed to create custom API client for {api_name}: {e}")
+        logger.debug("Failed to create custom API client for %s: %s", api_name, e)
         raise
 
 class HubspotAppService:
@@ -38,7 +38,7 @@ class HubspotAppService:
         """
         Initializes the HubspotAppService with the given configuration.
 
-        :param config: A HubspotIntegrationConfig instance containing API details.
+        :param config: The configuration dictionary containing API details.
         """
         self.config = config
         logger.debug("HubspotAppService initialized with config.")
@@ -63,5 +63,5 @@ class HubspotAppService:
             logger.debug("Successfully created HubSpot client.")
             return hubspot_client
         except Exception as e:
-            logger.debug(f"Failed to create HubSpot client: {e}")
+            logger.debug("Failed to create HubSpot client: %s", e)
             raise
@@ -39,7 +39,7 @@ class HubspotPortalService:
             logger.debug("Hubspot OAuth client created successfully.")
             return hubspot_client
         except Exception as e:
-            logger.error(f"Failed to create Hubspot OAuth client: {e}")
+            logger.error("Failed to create Hubspot OAuth client: %s", e)
             raise
 
     def get_hubspot_client_by_portalid(self, hubspot_portal_id: int):
@@ -51,11 +51,11 @@ class HubspotPortalService:
         """
         try:
             credentials = db.session.query(HubspotCredentials).filter_by(hubspot_portal_id=hubspot_portal_id).one()
-            logger.debug(f"Credentials retrieved for portal ID {hubspot_portal_id}.")
+            logger.debug("Credentials retrieved for portal ID %s.", hubspot_portal_id)
             return self.get_hubspot_client(credentials)
         except NoResultFound:
-            logger.error(f"No credentials found for portal ID {hubspot_portal_id}.")
+            logger.error("No credentials found for portal ID %s.", hubspot_portal_id)
             raise
         except Exception as e:
-            logger.error(f"Error retrieving Hubspot client: {e}")
+            logger.error("Error retrieving Hubspot client: %s", e)
             raise
\ No newline at end of file
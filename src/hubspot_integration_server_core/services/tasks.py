@@ -1,11 +1,109 @@
+import threading
+import time
+
 from celery import Task, shared_task
+from celery.exceptions import Ignore
 import redis
 
 # Import the configuration to get the broker URL for our custom client.
 from ..config import configuration
 
 # Create the Redis client for our rate limiter from the same broker URL.
-redis_client = redis.from_url(configuration['CELERY_BROKER_URL'], decode_responses=True)
+# The pool is shared by all worker threads; once all connections are in use,
+# callers wait for one to be released instead of failing. redis-py picks the
+# hiredis C parser automatically when it is installed (see 'redis[hiredis]').
+redis_pool = redis.BlockingConnectionPool.from_url(
+    configuration['CELERY_BROKER_URL'],
+    max_connections=64,
+    timeout=20,
+    decode_responses=True,
+)
+redis_client = redis.Redis(connection_pool=redis_pool, single_connection_client=False)
+
+# Atomically lease up to ARGV[3] tokens from the bucket, creating it with a TTL
+# on first use. Once the bucket holds ARGV[4] tokens or fewer, only a single token
+# is taken, so the tail of the bucket is never parked in one worker's lease.
+# Returns {tokens_granted, bucket_ttl_ms}.
+TOKEN_BUCKET_LUA = """
+local requested = tonumber(ARGV[3])
+local threshold = tonumber(ARGV[4])
+local tokens = redis.call('GET', KEYS[1])
+if not tokens then
+    tokens = tonumber(ARGV[1])
+    if tokens <= threshold then
+        requested = 1
+    end
+    local granted = math.min(requested, tokens)
+    redis.call('SET', KEYS[1], tokens - granted, 'EX', ARGV[2])
+    return {granted, ARGV[2] * 1000}
+end
+tokens = tonumber(tokens)
+if tokens <= threshold then
+    requested = 1
+end
+local granted = math.min(requested, tokens)
+if granted <= 0 then
+    return {0, redis.call('PTTL', KEYS[1])}
+end
+redis.call('DECRBY', KEYS[1], granted)
+return {granted, redis.call('PTTL', KEYS[1])}
+"""
+
+# The script object caches the SHA and calls EVALSHA, falling back to EVAL once.
+lease_tokens = redis_client.register_script(TOKEN_BUCKET_LUA)
+
+# Tokens leased from Redis but not yet spent by this worker thread,
+# as {bucket_key: (tokens_remaining, window_reset_monotonic)}. Only buckets with
+# unspent tokens are kept, and expired ones are swept out periodically.
+_local_tokens = threading.local()
+
+
+def _sweep_expired_leases(leases, now):
+    """Drop leases whose window has ended, e.g. for clients that were not seen again."""
+    for bucket_key in [key for key, (_, reset_at) in leases.items() if reset_at <= now]:
+        del leases[bucket_key]
+
+
+def _take_token(bucket_key, calls, period, lease_size):
+    """
+    Take one token for bucket_key, spending locally leased tokens first.
+
+    Redis is only consulted when the local lease is spent or its window has
+    expired. Leased tokens are already deducted from the shared bucket, so the
+    global rate limit still holds across workers. Batches are only leased while
+    more than half of the bucket is left; below that, tokens are taken one by one.
+    """
+    leases = getattr(_local_tokens, 'leases', None)
+    if leases is None:
+        leases = _local_tokens.leases = {}
+        _local_tokens.next_sweep = 0.0
+
+    now = time.monotonic()
+    lease = leases.pop(bucket_key, None)
+    if lease is not None:
+        remaining, reset_at = lease
+        if now < reset_at:
+            if remaining > 1:
+                leases[bucket_key] = (remaining - 1, reset_at)
+            return True
+
+    if now >= _local_tokens.next_sweep:
+        _sweep_expired_leases(leases, now)
+        _local_tokens.next_sweep = now + period
+
+    granted, ttl_ms = lease_tokens(keys=[bucket_key], args=[calls, period, lease_size, calls // 2])
+    if not granted:
+        return False
+
+    if ttl_ms < 0:
+        ttl_ms = period * 1000
+    if granted > 1:
+        leases[bucket_key] = (granted - 1, now + ttl_ms / 1000)
+    return True
+
+
+# Seconds per period unit accepted in rate limit strings.
+_PERIOD_MAP = {'s': 1, 'm': 60, 'h': 3600}
 
 
 def _parse_rate_limit(rate_limit_string):
@@ -22,14 +120,8 @@ def _parse_rate_limit(rate_limit_string):
     except (ValueError, TypeError):
         raise ValueError(f"Invalid call limit '{parts[0]}'. Must be an integer.")
 
-    period_char = parts[1].lower()
-    if period_char == 's':
-        period_seconds = 1
-    elif period_char == 'm':
-        period_seconds = 60
-    elif period_char == 'h':
-        period_seconds = 3600
-    else:
+    period_seconds = _PERIOD_MAP.get(parts[1].lower())
+    if period_seconds is None:
         raise ValueError(f"Invalid period '{parts[1]}'. Use 's', 'm', or 'h'.")
 
     return limit, period_seconds
@@ -38,7 +130,7 @@ def _parse_rate_limit(rate_limit_string):
 class RateLimitedTask(Task):
     """
     This custom base Task implements the token bucket algorithm for API rate limiting.
-    Rate limit values are parsed lazily on first call.
+    Rate limit values are parsed once, when the task class is created by the decorator.
     """
     abstract = True
 
@@ -48,63 +140,91 @@ class RateLimitedTask(Task):
 
     _rate_limit_calls = None
     _rate_limit_period = None
-    _rate_limit_initialized = False
+    # Number of tokens a worker thread leases from Redis at once while more than half
+    # of the bucket is left. Leased tokens can only be spent by that thread for that
+    # client_id, so with many worker processes idle leases can hold back up to half
+    # of the limit and cause early rescheduling; lower it (down to 1, one Redis call
+    # per task) via create_api_task_decorator's lease_size for high concurrency.
+    _rate_limit_lease = 1
+    # "<base_key_prefix>:<task name>:", built on first call once the task name is known;
+    # None until _initialize_rate_limit() has validated the attributes above.
+    _bucket_prefix = None
 
     def _initialize_rate_limit(self):
-        """Parse the rate limit string and set the internal values."""
-        if not self._rate_limit_initialized:
-            if not hasattr(self, 'base_key_prefix') or self.base_key_prefix is None:
-                raise NotImplementedError("Subclasses of RateLimitedTask must define a 'base_key_prefix'.")
+        """
+        Validate the rate limit attributes and build the bucket key prefix. Runs on the
+        first call only; tasks created by the decorator already carry parsed values,
+        direct subclasses have their 'rate_limit' string parsed here.
+        """
+        if self.base_key_prefix is None:
+            raise NotImplementedError("Subclasses of RateLimitedTask must define a 'base_key_prefix'.")
+        if self._rate_limit_calls is None:
             if self.rate_limit is None:
                 raise ValueError("Task 'rate_limit' attribute cannot be None.")
-
             self._rate_limit_calls, self._rate_limit_period = _parse_rate_limit(self.rate_limit)
-            self._rate_limit_initialized = True
+
+        self._bucket_prefix = f"{self.base_key_prefix}:{self.name}:"
+        return self._bucket_prefix
 
     def __call__(self, *args, **kwargs):
         """
         This method is executed by the worker *before* the task's run() method.
         We inject the rate-limiting logic here.
         """
-        self._initialize_rate_limit()
-
         # The first argument to the task is assumed to be the client_id for rate limiting.
         if not args:
             raise ValueError("RateLimitedTask requires a client_id as the first argument.")
         client_id = args[0]
 
-        bucket_key = f"{self.base_key_prefix}:{self.name}:{client_id}"
-
-        pipe = redis_client.pipeline()
-        pipe.get(bucket_key)
-        pipe.decr(bucket_key)
-        tokens_before, tokens_after = pipe.execute()
-
-        if tokens_before is None:
-            # First call for this key, set the token bucket with a TTL.
-            redis_client.setex(bucket_key, self._rate_limit_period, self._rate_limit_calls - 1)
-            return super().__call__(*args, **kwargs)
-
-        if tokens_after < 0:
-            # Rate limit exceeded, increment back the token count and retry the task.
-            redis_client.incr(bucket_key)
-            self.retry(countdown=self._rate_limit_period)
+        # The prefix is fixed per task, so build it once and only append the client_id.
+        bucket_prefix = self._bucket_prefix
+        if bucket_prefix is None:
+            bucket_prefix = self._initialize_rate_limit()
+        bucket_key = bucket_prefix + str(client_id)
+
+        allowed = _take_token(
+            bucket_key, self._rate_limit_calls, self._rate_limit_period, self._rate_limit_lease,
+        )
+
+        if not allowed:
+            # Rate limit exceeded, reschedule the task once the bucket has been refilled.
+            # The signature keeps the task id and its link/errback/chain/chord options;
+            # Ignore stops this run from recording a result or firing callbacks.
+            self.signature_from_request(
+                args=args, kwargs=kwargs, countdown=self._rate_limit_period,
+            ).apply_async()
+            raise Ignore()
 
         return super().__call__(*args, **kwargs)
 
 
-def create_api_task_decorator(key_prefix, rate_limit_string):
+def create_api_task_decorator(key_prefix, rate_limit_string, lease_size=None):
     """
     A generic factory that creates a decorator for API tasks.
 
     :param key_prefix: The unique string to use for this API's Redis keys.
     :param rate_limit_string: The rate limit string (e.g., '10/s').
+    :param lease_size: Tokens a worker thread leases from Redis at once. Defaults to a
+        tenth of the limit; use a smaller value when many workers share one client.
     """
+    # Parse once per decorator; every task it creates shares the same values. An unset
+    # rate limit is left to _initialize_rate_limit(), which raises on the first call,
+    # so importing this module works without one.
+    if rate_limit_string:
+        calls, period = _parse_rate_limit(rate_limit_string)
+        lease = max(1, lease_size if lease_size is not None else calls // 10)
+    else:
+        calls = period = None
+        lease = 1
+
     def wrapper(func):
         class CustomTask(RateLimitedTask):
             # Set the required class attributes on our dynamic task class
             base_key_prefix = key_prefix
             rate_limit = rate_limit_string
+            _rate_limit_calls = calls
+            _rate_limit_period = period
+            _rate_limit_lease = lease
 
         return shared_task(base=CustomTask, bind=True)(func)
     return wrapper
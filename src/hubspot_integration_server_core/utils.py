@@ -9,7 +9,6 @@ from flask import request, abort
 
 # Set up a logger instance
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 def validate_hubspot_signature(config: dict):
     """Decorator to validate HubSpot signatures on Flask routes.
@@ -19,7 +18,7 @@ def validate_hubspot_signature(config: dict):
     timestamp provided in headers against the client secret.
 
     Args:
-        config (HubspotIntegrationConfig): Configuration containing client secret.
+        config (dict): Configuration containing client secret.
 
     Raises:
         403 Forbidden: If the signature is invalid.
@@ -38,7 +37,7 @@ def validate_hubspot_signature(config: dict):
             request_body = request.get_data(as_text=True)
 
             # Log the extracted request details for debugging
-            logger.debug(f"Request Method: {request_method}, URI: {request_uri}, Body: {request_body}")
+            logger.debug("Request Method: %s, URI: %s, Body: %s", request_method, request_uri, request_body)
 
             try:
                 # Validate the signature using Signature utility
@@ -56,7 +55,7 @@ def validate_hubspot_signature(config: dict):
 
             except (InvalidSignatureVersionError, InvalidSignatureTimestampError) as e:
                 # Log error details for debugging
-                logger.debug(f"Signature validation error: {str(e)}")
+                logger.debug("Signature validation error: %s", e)
                 abort(400, description=str(e))
 
             return f(*args, **kwargs)